@@ -87,15 +87,15 @@ except ValueError as error:
     print(f"Error occurred: {error}")
     sys_exit(1)
 
+mapping = rest_api_to_gui.mapping
 for param_name in rest_api_to_gui.parameter_names:
-    rest_api_to_gui.parameter_name = param_name
-    display_name = rest_api_to_gui.parameter_display_name
-    section = rest_api_to_gui.parameter_section
-    if display_name in ["", None]:
+    info = mapping[param_name]
+    display_name = info.get("display_name")
+    if not display_name:
         continue
-    MESSAGE = f"API Key: {rest_api_to_gui.parameter_name}\n"
-    MESSAGE += f"  Description: {rest_api_to_gui.parameter_description}\n"
-    MESSAGE += f"  GUI Section: {section}\n"
+    MESSAGE = f"API Key: {param_name}\n"
+    MESSAGE += f"  Description: {info.get('description', '')}\n"
+    MESSAGE += f"  GUI Section: {info.get('section', '')}\n"
     MESSAGE += f"  GUI Field Name: {display_name}\n"
-    MESSAGE += f"  Parameter Type: {rest_api_to_gui.parameter_type}\n"
+    MESSAGE += f"  Parameter Type: {info.get('type', '')}\n"
     print(MESSAGE)
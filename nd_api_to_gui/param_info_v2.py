@@ -505,6 +505,39 @@ class ParamInfo:
             msg += "appropriate for the fabric type."
             raise ValueError(msg)
 
+    def info_for(
+        self, parameter_name: str
+    ) -> tuple[str, str, str, Union[str, None], Union[bool, None]]:
+        """
+        # Summary
+
+        Return the description, display_name, section, type, and internal
+        values for parameter_name in a single lookup.
+
+        Use this instead of setting parameter_name and reading the
+        individual parameter_* properties when iterating over many
+        parameters.
+
+        ## Raises
+
+        `ValueError` if:
+            - parameter_name is not found in the template
+        """
+        method_name: str = "info_for"
+        try:
+            info = self.info[parameter_name]
+        except KeyError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Parameter {parameter_name} not found in template."
+            raise ValueError(msg) from error
+        return (
+            info["description"],
+            info["display_name"],
+            info["section"],
+            info["type"],
+            info["internal"],
+        )
+
     @property
     def parameter_choices(self) -> Union[list[Any], None]:
         """
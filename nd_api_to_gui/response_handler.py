@@ -21,10 +21,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type  # pylint: disable=invalid-name
 __author__ = "Allen Robel"
 
-import copy
-import inspect
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
 
 class ResponseHandler:
@@ -95,21 +93,30 @@ class ResponseHandler:
 
     """
 
+    __slots__ = (
+        "class_name",
+        "log",
+        "_implements",
+        "_response",
+        "_result",
+        "_verb",
+    )
+
+    _RETURN_CODES_SUCCESS: ClassVar[frozenset[int]] = frozenset({200, 404})
+    _VALID_VERBS: ClassVar[frozenset[str]] = frozenset({"DELETE", "GET", "POST", "PUT"})
+    _VALID_VERBS_STR: ClassVar[str] = ", ".join(sorted(_VALID_VERBS))
+
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
-        method_name: str = inspect.stack()[0][3]
         self._implements: str = "response_handler_v1"
 
         self.log: logging.Logger = logging.getLogger(f"dcnm.{self.class_name}")
 
         self._response: dict[str, Any] = {}
         self._result: dict[str, bool] = {}
-        self._return_codes_success: set[int] = {200, 404}
-        self._valid_verbs: set[str] = {"DELETE", "GET", "POST", "PUT"}
         self._verb: str = ""
 
-        msg: str = f"ENTERED {self.class_name}.{method_name}"
-        self.log.debug(msg)
+        self.log.debug("ENTERED %s.__init__", self.class_name)
 
     def _handle_response(self) -> None:
         """
@@ -128,7 +135,7 @@ class ResponseHandler:
             msg += f"{self.class_name}._handle_response"
             self.log.error(msg)
             raise ValueError(msg)
-        if self.verb == "GET":
+        if self._verb == "GET":
             self._get_response()
         else:
             self._post_put_delete_response()
@@ -156,30 +163,22 @@ class ResponseHandler:
         -   `ValueError` if:
                 -   `response` is not set.
         """
-        result: dict[str, bool] = {}
-        if not self.response:
+        response = self._response
+        if not response:
             msg = f"{self.class_name}._get_response: "
             msg += "response must be set prior to calling "
             msg += f"{self.class_name}._get_response"
             self.log.error(msg)
             raise ValueError(msg)
 
-        if (
-            self.response.get("RETURN_CODE") == 404
-            and self.response.get("MESSAGE") == "Not Found"
-        ):
-            result["found"] = False
-            result["success"] = True
-        elif (
-            self.response.get("RETURN_CODE") not in self._return_codes_success
-            or self.response.get("MESSAGE") != "OK"
-        ):
-            result["found"] = False
-            result["success"] = False
+        return_code = response.get("RETURN_CODE")
+        message = response.get("MESSAGE")
+        if return_code == 404 and message == "Not Found":
+            self._result = {"found": False, "success": True}
+        elif return_code not in self._RETURN_CODES_SUCCESS or message != "OK":
+            self._result = {"found": False, "success": False}
         else:
-            result["found"] = True
-            result["success"] = True
-        self._result = copy.copy(result)
+            self._result = {"found": True, "success": True}
 
     def _post_put_delete_response(self) -> None:
         """
@@ -205,27 +204,21 @@ class ResponseHandler:
         -   `ValueError` if:
                 -   `response` is not set.
         """
-        method_name: str = inspect.stack()[0][3]
-        result: dict[str, bool] = {}
-        if not self.response:
+        method_name: str = "_post_put_delete_response"
+        response = self._response
+        if not response:
             msg = f"{self.class_name}.{method_name}: "
             msg += "response must be set prior to calling "
             msg += f"{self.class_name}.{method_name}"
             self.log.error(msg)
             raise ValueError(msg)
-        if self.response.get("ERROR") is not None:
-            result["success"] = False
-            result["changed"] = False
-        elif (
-            self.response.get("MESSAGE") != "OK"
-            and self.response.get("MESSAGE") is not None
-        ):
-            result["success"] = False
-            result["changed"] = False
+        message = response.get("MESSAGE")
+        if response.get("ERROR") is not None:
+            self._result = {"success": False, "changed": False}
+        elif message != "OK" and message is not None:
+            self._result = {"success": False, "changed": False}
         else:
-            result["success"] = True
-            result["changed"] = True
-        self._result = copy.copy(result)
+            self._result = {"success": True, "changed": True}
 
     def commit(self) -> None:
         """
@@ -240,11 +233,14 @@ class ResponseHandler:
                 -   `response` is not set.
                 -   `verb` is not set.
         """
-        method_name: str = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"verb: {self.verb}, "
-        msg += f"response {self.response}"
-        self.log.debug(msg)
+        method_name: str = "commit"
+        self.log.debug(
+            "%s.%s: verb: %s, response %s",
+            self.class_name,
+            method_name,
+            self._verb,
+            self._response,
+        )
         if not self.response:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.response must be set prior to calling "
@@ -293,7 +289,7 @@ class ResponseHandler:
 
     @response.setter
     def response(self, value: dict[str, Any]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "response"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{self.class_name}.{method_name} must be a dict. "
@@ -343,11 +339,11 @@ class ResponseHandler:
 
     @verb.setter
     def verb(self, value: str) -> None:
-        method_name: str = inspect.stack()[0][3]
-        if value not in self._valid_verbs:
+        method_name: str = "verb"
+        if value not in self._VALID_VERBS:
             msg = f"{self.class_name}.{method_name}: "
             msg += "verb must be one of "
-            msg += f"{', '.join(sorted(self._valid_verbs))}. "
+            msg += f"{self._VALID_VERBS_STR}. "
             msg += f"Got {value}."
             raise ValueError(msg)
         self._verb = value
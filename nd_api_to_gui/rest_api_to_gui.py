@@ -21,10 +21,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type  # pylint: disable=invalid-name
 __author__ = "Allen Robel"
 
-import copy
-import inspect
 import logging
-from typing import Any
+from typing import Any, ClassVar, Union
 
 from nd_api_to_gui.exceptions import ControllerResponseError
 from nd_api_to_gui.operation_type import OperationType
@@ -61,15 +59,45 @@ class RestApiToGui:
     instance.commit()
     mapping = instance.mapping  # The mapping between REST API parameters and GUI field names (optional)
     for param_name in instance.parameter_names:
-        instance.parameter_name = param_name
-        display_name = instance.param_info.parameter_display_name  # Get display name for parameter
-        section = instance.param_info.parameter_section  # Get section for parameter
+        info = mapping[param_name]  # or instance.parameter_info(param_name)
+        display_name = info.get("display_name", "")  # Get display name for parameter
+        section = info.get("section", "")  # Get section for parameter
     ```
 
+    ## Notes
+
+    -   Mappings are cached per (controller, template_name) at the class
+        level.  Calling commit() again for a template_name that was already
+        processed (by any instance) on the same controller reuses the cached
+        mapping rather than retrieving the template from the controller
+        again.  Each instance gets its own copy of the cached mapping.
+        Call RestApiToGui.clear_mapping_cache() to discard cached mappings.
+
     """
 
+    __slots__ = (
+        "action",
+        "class_name",
+        "log",
+        "operation_type",
+        "_fabric_group_default_config",
+        "_fabric_group_name",
+        "_param_info",
+        "_parameter_name",
+        "_parameter_names",
+        "_refreshed",
+        "_rest_api_parameter_to_gui_mapping",
+        "_rest_send",
+        "_results",
+        "_template",
+        "_template_get",
+        "_template_name",
+    )
+
+    # (controller ip4 or ip6, template_name) -> mapping
+    _mapping_cache: ClassVar[dict[tuple[str, str], dict[str, dict[str, str]]]] = {}
+
     def __init__(self) -> None:
-        method_name = inspect.stack()[0][3]
         self.class_name = self.__class__.__name__
         self.log = logging.getLogger(f"dcnm.{self.class_name}")
 
@@ -80,19 +108,18 @@ class RestApiToGui:
         self._fabric_group_name: str = ""
         self._parameter_name: str = ""
         self._parameter_names: list[str] = []
-        self._param_info: ParamInfo = ParamInfo()
+        self._param_info: Union[ParamInfo, None] = None
         self._refreshed: bool = False
         self._rest_api_parameter_to_gui_mapping: dict[str, dict[str, str]] = {}
-        self._rest_send: RestSend = RestSend({})
-        self._results: Results = Results()
-        self._results.action = self.action
-        self._results.operation_type = self.operation_type
+        # Collaborators are created on first use.  See _get_param_info(),
+        # _get_template(), and the rest_send and results getters.
+        self._rest_send: Union[RestSend, None] = None
+        self._results: Union[Results, None] = None
         self._template: dict[str, Any] = {}
-        self._template_get: TemplateGet = TemplateGet()
+        self._template_get: Union[TemplateGet, None] = None
         self._template_name: str = ""
 
-        msg = f"{self.class_name}.{method_name}: DONE"
-        self.log.debug(msg)
+        self.log.debug("%s.__init__: DONE", self.class_name)
 
     def commit(self) -> None:
         """
@@ -105,23 +132,56 @@ class RestApiToGui:
         -   `ValueError` if:
             -   `template_name` is not set.
             -   `rest_send` is not set.
+            -   `rest_send.sender` is not set.
         """
-        method_name = inspect.stack()[0][3]
+        method_name = "commit"
         msg: str = ""
         if not self.template_name:
             msg = f"{self.class_name}.{method_name}: "
             msg += "template_name must be set."
             raise ValueError(msg)
 
-        if not self.rest_send.params:
+        if self._rest_send is None or not self._rest_send.params:
             msg = f"{self.class_name}.{method_name}: "
             msg += "rest_send must be set to an instance of RestSend with params set."
             raise ValueError(msg)
 
-        self._build_rest_api_parameter_to_gui_mapping()
-        self._parameter_names = list(self._rest_api_parameter_to_gui_mapping.keys())
+        try:
+            sender = self._rest_send.sender
+        except AttributeError as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "rest_send.sender must be set."
+            raise ValueError(msg) from error
+
+        cache_key = (sender.ip4 or sender.ip6, self._template_name)
+        mapping = self._mapping_cache.get(cache_key)
+        if mapping is None:
+            self._build_rest_api_parameter_to_gui_mapping()
+            mapping = self._rest_api_parameter_to_gui_mapping
+            self._mapping_cache[cache_key] = {
+                name: dict(info) for name, info in mapping.items()
+            }
+        else:
+            self._rest_api_parameter_to_gui_mapping = {
+                name: dict(info) for name, info in mapping.items()
+            }
+        self._parameter_names = sorted(self._rest_api_parameter_to_gui_mapping)
         self._refreshed = True
 
+    @classmethod
+    def clear_mapping_cache(cls) -> None:
+        """
+        # Summary
+
+        Discard all cached mappings.  The next commit() for any
+        template_name retrieves the template from the controller again.
+
+        ## Raises
+
+        None
+        """
+        cls._mapping_cache.clear()
+
     def _get_template(self) -> None:
         """
         # Summary
@@ -132,11 +192,16 @@ class RestApiToGui:
 
         -   `ValueError` if unable to retrieve template from controller.
         """
-        method_name = inspect.stack()[0][3]
-        msg: str = f"{self.class_name}.{method_name}: "
-        msg += f"Retrieving template: {self._template_name} from controller."
-        self.log.debug(msg)
+        method_name = "_get_template"
+        self.log.debug(
+            "%s.%s: Retrieving template: %s from controller.",
+            self.class_name,
+            method_name,
+            self._template_name,
+        )
 
+        if self._template_get is None:
+            self._template_get = TemplateGet()
         self._template_get.rest_send = self.rest_send
         self._template_get.results = Results()
         self._template_get.template_name = self._template_name
@@ -163,33 +228,28 @@ class RestApiToGui:
             param["name"] for param in self._template.get("parameters", [])
         ]
 
-    def _parse_parameter_info(self) -> None:
-        """
-        Parse param info from the template.
-        """
-        self._param_info.template = copy.deepcopy(self._template)
-        self._param_info.raise_on_missing = False
-        self._param_info.refresh()
-
-    def _skip(self, param_name: str) -> bool:
+    def _get_param_info(self) -> ParamInfo:
         """
         # Summary
 
-        Determine if a parameter should be skipped.
+        Return the ParamInfo instance, creating it on first use.
 
         ## Raises
 
         None
         """
-        if self._param_info.parameter_internal:
-            return True
-        if self._param_info.parameter_section == "Hidden":
-            return True
-        if "_PREV" in param_name:
-            return True
-        if "DCNM_ID" in param_name:
-            return True
-        return False
+        if self._param_info is None:
+            self._param_info = ParamInfo()
+        return self._param_info
+
+    def _parse_parameter_info(self) -> None:
+        """
+        Parse param info from the template.
+        """
+        param_info = self._get_param_info()
+        param_info.template = self._template
+        param_info.raise_on_missing = False
+        param_info.refresh()
 
     def _build_mapping(self) -> None:
         """
@@ -197,35 +257,34 @@ class RestApiToGui:
 
         Build the mapping between REST API parameters and GUI field names.
 
+        Parameters are skipped if they are internal, are in the "Hidden"
+        section, or their name contains "_PREV" or "DCNM_ID".
+
         ## Raises
 
         None
         """
-        self._rest_api_parameter_to_gui_mapping = {}
+        param_info = self._get_param_info()
+        mapping: dict[str, dict[str, str]] = {}
         for param_name in self._parameter_names:
-            self._param_info.parameter_name = param_name
-            if self._skip(param_name):
+            description, display_name, section, param_type, internal = (
+                param_info.info_for(param_name)
+            )
+            if (
+                internal
+                or section == "Hidden"
+                or "_PREV" in param_name
+                or "DCNM_ID" in param_name
+            ):
                 continue
-            if param_name not in self._rest_api_parameter_to_gui_mapping:
-                self._rest_api_parameter_to_gui_mapping[param_name] = {}
-            description = self._param_info.parameter_description
-            display_name = self._param_info.parameter_display_name
-            section = self._param_info.parameter_section
-            param_type = self._param_info.parameter_type
-            if param_type:
-                self._rest_api_parameter_to_gui_mapping[param_name][
-                    "type"
-                ] = param_type
-            if description:
-                self._rest_api_parameter_to_gui_mapping[param_name][
-                    "description"
-                ] = description
-            if display_name:
-                self._rest_api_parameter_to_gui_mapping[param_name][
-                    "display_name"
-                ] = display_name
-            if section:
-                self._rest_api_parameter_to_gui_mapping[param_name]["section"] = section
+            fields = (
+                ("type", param_type),
+                ("description", description),
+                ("display_name", display_name),
+                ("section", section),
+            )
+            mapping[param_name] = {key: value for key, value in fields if value}
+        self._rest_api_parameter_to_gui_mapping = mapping
 
     def _build_rest_api_parameter_to_gui_mapping(self) -> None:
         """
@@ -242,6 +301,29 @@ class RestApiToGui:
         self._set_parameter_names()
         self._build_mapping()
 
+    def parameter_info(self, name: str) -> dict[str, str]:
+        """
+        # Summary
+
+        Return the mapping entry for parameter name.
+
+        The returned dict contains any of the keys "description",
+        "display_name", "section", and "type" for which the template
+        provides a value.  An empty dict is returned if name is not
+        in the mapping.
+
+        ## Raises
+
+        `ValueError` if:
+            - commit has not been called (self._refreshed is False).
+        """
+        method_name: str = "parameter_info"
+        if not self._refreshed:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Call {self.class_name}.commit before calling {method_name}."
+            raise ValueError(msg)
+        return self._rest_api_parameter_to_gui_mapping.get(name, {})
+
     @property
     def config(self) -> dict[str, Any]:
         """
@@ -255,6 +337,31 @@ class RestApiToGui:
         """
         return self._fabric_group_default_config
 
+    @property
+    def mapping(self) -> dict[str, dict[str, str]]:
+        """
+        # Summary
+
+        Return the mapping between REST API parameters and GUI field names.
+
+        The mapping is keyed on parameter name.  Each value is a dict
+        containing any of the keys "description", "display_name", "section",
+        and "type" for which the template provides a value.  The mapping is
+        owned by this instance; modifying it does not affect the class-level
+        cache or other instances.
+
+        ## Raises
+
+        `ValueError` if:
+            - commit has not been called (self._refreshed is False).
+        """
+        method_name: str = "mapping"
+        if not self._refreshed:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"Call {self.class_name}.commit before accessing {method_name}."
+            raise ValueError(msg)
+        return self._rest_api_parameter_to_gui_mapping
+
     @property
     def parameter_description(self) -> str:
         """
@@ -266,7 +373,7 @@ class RestApiToGui:
 
         None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "parameter_description"
         if not self._refreshed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before accessing {method_name}."
@@ -293,7 +400,7 @@ class RestApiToGui:
 
         None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "parameter_display_name"
         if not self._refreshed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before accessing {method_name}."
@@ -332,19 +439,21 @@ class RestApiToGui:
         """
         # Summary
 
-        Return a list of parameter names found in the mapping.
+        Return a sorted list of parameter names found in the mapping.
+
+        The list is sorted once by commit(); callers should not modify it.
 
         ## Raises
 
         `ValueError` if:
             - commit has not been called (self._refreshed is False).
         """
-        method_name: str = inspect.stack()[0][3]  # pylint: disable=unused-variable
+        method_name: str = "parameter_names"  # pylint: disable=unused-variable
         if not self._refreshed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before accessing parameter_names."
             raise ValueError(msg)
-        return sorted(list(self._parameter_names))
+        return self._parameter_names
 
     @property
     def parameter_section(self) -> str:
@@ -359,7 +468,7 @@ class RestApiToGui:
             -   commit has not been called (self._refreshed is False).
             -   parameter_name is not set.
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "parameter_section"
         if not self._refreshed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before accessing {method_name}."
@@ -386,7 +495,7 @@ class RestApiToGui:
 
         None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "parameter_type"
         if not self._refreshed:
             msg = f"{self.class_name}.{method_name}: "
             msg += f"Call {self.class_name}.commit before accessing {method_name}."
@@ -409,10 +518,15 @@ class RestApiToGui:
 
         An instance of the RestSend class.
 
+        If not set, an unconfigured RestSend instance is created on first
+        access.
+
         ## Raises
 
         -   `ValueError` if `params` is not set on the RestSend instance.
         """
+        if self._rest_send is None:
+            self._rest_send = RestSend({})
         return self._rest_send
 
     @rest_send.setter
@@ -430,10 +544,16 @@ class RestApiToGui:
 
         An instance of the Results class.
 
+        If not set, a Results instance is created on first access.
+
         ## Raises
 
         -  `ValueError` if the value passed to the setter is not an instance of Results.
         """
+        if self._results is None:
+            self._results = Results()
+            self._results.action = self.action
+            self._results.operation_type = self.operation_type
         return self._results
 
     @results.setter
@@ -442,10 +562,10 @@ class RestApiToGui:
             msg = f"{self.class_name}.results must be set to an "
             msg += "instance of Results."
             raise ValueError(msg)
+        value.action = self.action
+        value.changed.add(False)
+        value.operation_type = self.operation_type
         self._results = value
-        self._results.action = self.action
-        self._results.changed.add(False)
-        self._results.operation_type = self.operation_type
 
     @property
     def template_name(self) -> str:
@@ -23,16 +23,18 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type  # pylint: disable=invalid-name
 __author__ = "Allen Robel"
 
-import copy
 import inspect
 import json
 import logging
-from collections import deque
+import ssl
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
-from typing import Any
+from typing import Any, Callable, Union
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 
     HAS_REQUESTS = True
 except ImportError:
@@ -45,6 +47,22 @@ try:
 except ImportError:
     HAS_URLLIB3 = False
 
+# Optional.  Faster JSON encoding/decoding of payloads and responses.
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional.  Only needed when ND_HTTP2=1.  See Sender docstring.
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
 MESSAGE: str = ""
 if HAS_REQUESTS is False:
     MESSAGE = "requests is not installed. "
@@ -56,6 +74,110 @@ if HAS_URLLIB3 is False:
     MESSAGE += "install with e.g. pip install urllib3"
     raise ImportError(MESSAGE)
 
+# Exceptions raised by either backend when the controller is unreachable.
+_CONNECTION_ERRORS: tuple[type[Exception], ...] = (requests.exceptions.ConnectionError,)
+if HAS_HTTPX is True:
+    _CONNECTION_ERRORS += (httpx.NetworkError, httpx.ConnectTimeout)
+
+# Maximum number of responses kept by Sender for conditional GETs.
+_ETAG_CACHE_SIZE: int = 8
+
+# Set by the first Sender() so urllib3.disable_warnings() runs once.
+_WARNINGS_DISABLED: bool = False
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    """
+    # Summary
+
+    Serialize value to JSON with orjson.  Non-str dict keys are
+    converted to str, as json.dumps does.
+
+    ## Raises
+
+    -   `TypeError` (`orjson.JSONEncodeError`) if value is not JSON
+        serializable.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Serialize request bodies and deserialize responses, using orjson if
+# installed.  orjson returns bytes, which both backends send without
+# re-encoding.  Both loads raise ValueError for invalid JSON.
+_json_dumps: Callable[[Any], Union[bytes, str]]
+_json_loads: Callable[[bytes], Any]
+if HAS_ORJSON is True:
+    _json_dumps = _orjson_dumps
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+class _RedactSecretsFilter(logging.Filter):
+    """
+    # Summary
+
+    Mask the values of secret keys (e.g. `userPasswd`) in dict
+    arguments of log records.
+
+    Logger filters run only for records that pass the level check, so
+    payloads are never copied when DEBUG logging is disabled.
+
+    ## Raises
+
+    None
+    """
+
+    secret_keys: frozenset[str] = frozenset({"userPasswd"})
+
+    def _redact(self, value: Any) -> Any:
+        if isinstance(value, dict) and not self.secret_keys.isdisjoint(value):
+            return {
+                key: "********" if key in self.secret_keys else item
+                for key, item in value.items()
+            }
+        return value
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(self._redact(arg) for arg in record.args)
+        elif isinstance(record.args, dict):
+            record.args = self._redact(record.args)
+        return True
+
+
+_REDACT_SECRETS: _RedactSecretsFilter = _RedactSecretsFilter()
+
+
+class _UnverifiedTLSAdapter(HTTPAdapter):
+    """
+    # Summary
+
+    `HTTPAdapter` whose connection pools share a single, pre-built
+    `ssl.SSLContext` with certificate and hostname verification disabled.
+
+    Controllers commonly use self-signed certificates.  Building the
+    context once avoids urllib3 creating a new context for every new
+    connection.
+
+    ## Raises
+
+    None
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # HTTPAdapter.__init__() calls init_poolmanager(), so the context
+        # must exist before calling it.
+        self._ssl_context: ssl.SSLContext = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["ssl_context"] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
 
 class Sender:
     """
@@ -123,21 +245,54 @@ class Sender:
     # etc...
     # See rest_send_v2.py for RestSend() usage.
     ```
+
+    ## Connection reuse
+
+    Requests are sent through a `requests.Session`, so the TCP/TLS
+    connection to the controller is reused across calls.  Call `close()`
+    when finished, or use the instance as a context manager:
+
+    ```python
+    with Sender() as sender:
+        sender.login()
+        # etc...
+    ```
+
+    Proxy settings in the environment (HTTP_PROXY, HTTPS_PROXY,
+    NO_PROXY, etc.) and ~/.netrc are not used.
+
+    ## HTTP/2
+
+    If the environment variable `ND_HTTP2` is set to `1`, requests are
+    sent with an `httpx.Client` configured for HTTP/2 instead of
+    `requests.Session`.  This requires the optional `http2` extra
+    (e.g. `uv sync --extra http2`).  The connection falls
+    back to HTTP/1.1 if the controller does not negotiate HTTP/2.
     """
 
     def __init__(self) -> None:
         self.class_name: str = self.__class__.__name__
         self._implements: str = "sender_v1"
 
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        global _WARNINGS_DISABLED  # pylint: disable=global-statement
+        if _WARNINGS_DISABLED is False:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _WARNINGS_DISABLED = True
         self.log: logging.Logger = logging.getLogger(f"dcnm.{self.class_name}")
+        if _REDACT_SECRETS not in self.log.filters:
+            self.log.addFilter(_REDACT_SECRETS)
 
         self._domain: str = environ.get("ND_DOMAIN", "local")
+        # url -> (ETag, DATA), least recently used first.  Only for paths
+        # registered with enable_etag_cache().
+        self._etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._etag_paths: set[str] = set()
         self._headers: dict[str, str] = {}
-        self._history_rc: deque = deque(maxlen=50)
-        self._history_path: deque = deque(maxlen=50)
+        self._history: deque[tuple[int, str]] = deque(maxlen=50)
         self._ip4: str = environ.get("ND_IP4", "")
         self._ip6: str = environ.get("ND_IP6", "")
+        self._base_url: str = ""
+        self._update_base_url()
         self._jwttoken: str = ""
         self._last_rc: int = -1
         self._last_url: str = ""
@@ -154,6 +309,56 @@ class Sender:
         self._username: str = environ.get("ND_USERNAME", "admin")
         self._verb: str = ""
 
+        # Static headers are set once here; the auth headers are set by
+        # _set_token() whenever the token changes.
+        self._session: requests.Session = requests.Session()
+        self._session.headers["Content-Type"] = "application/json"
+        # Skip the per-request proxy/netrc/CA bundle environment lookups.
+        self._session.trust_env = False
+        adapter = _UnverifiedTLSAdapter(
+            pool_connections=4, pool_maxsize=20, max_retries=0
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._http2: bool = environ.get("ND_HTTP2", "") == "1"
+        self._client: Union["httpx.Client", None] = None
+        if self._http2:
+            if HAS_HTTPX is False:
+                msg = f"{self.class_name}.__init__: "
+                msg += "ND_HTTP2=1 requires httpx. "
+                msg += "install with e.g. uv sync --extra http2"
+                raise ImportError(msg)
+            self._client = httpx.Client(
+                http2=True,
+                verify=False,
+                trust_env=False,
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=20),
+                headers={"Content-Type": "application/json"},
+            )
+
+    def __enter__(self) -> "Sender":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        # Summary
+
+        Close the underlying `requests.Session` (and `httpx.Client`, if
+        ND_HTTP2=1) and release their pooled connections.
+
+        ## Raises
+
+        None
+        """
+        self._session.close()
+        if self._client is not None:
+            self._client.close()
+
     def _verify_commit_parameters(self) -> None:
         """
         # Summary
@@ -165,7 +370,7 @@ class Sender:
         -   `ValueError` if `verb` is not set
         -   `ValueError` if `path` is not set
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "_verify_commit_parameters"
         if not self._ip4 and not self._ip6:
             msg = f"{self.class_name}.{method_name}: "
             msg += "ip4 or ip6 must be set before calling commit()."
@@ -190,12 +395,24 @@ class Sender:
         -   `ValueError` if:
                 -   `path` is not set.
                 -   `verb` is not set.
+
+        ## Notes
+
+        -   For a GET to a path registered with `enable_etag_cache()`, a
+            304 (Not Modified) response from the controller is reported
+            in `response` as RETURN_CODE 200, MESSAGE "OK", with the
+            cached DATA.
         """
-        method_name: str = inspect.stack()[0][3]
-        caller: str = inspect.stack()[1][3]
-        msg: str = f"{self.class_name}.{method_name}: "
-        msg += f"Caller: {caller}, ENTERED"
-        self.log.debug(msg)
+        method_name: str = "commit"
+        debug: bool = self.log.isEnabledFor(logging.DEBUG)
+        caller: str = ""
+        if debug:
+            frame = inspect.currentframe()
+            if frame is not None and frame.f_back is not None:
+                caller = frame.f_back.f_code.co_name
+            self.log.debug(
+                "%s.%s: Caller: %s, ENTERED", self.class_name, method_name, caller
+            )
 
         try:
             self._verify_commit_parameters()
@@ -205,132 +422,228 @@ class Sender:
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
         self._set_url()
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"caller: {caller}.  "
-        msg += f"Calling requests: verb {self._verb}, "
-        msg += f"path {self._path}, "
-        msg += f"url {self._url}, "
+        # userPasswd in the payload is masked by _REDACT_SECRETS.
+        self.log.debug(
+            "%s.%s: caller: %s.  Calling requests: "
+            "verb %s, path %s, url %s, payload: %s",
+            self.class_name,
+            method_name,
+            caller,
+            self._verb,
+            self._path,
+            self._url,
+            self._payload,
+        )
+        etag_url: Union[str, None] = None
+        headers: Union[dict[str, str], None] = None
+        if self._verb == "GET" and self._path in self._etag_paths:
+            etag_url = self._url
+            cached = self._etag_cache.get(etag_url)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
         try:
             if self._payload is None:
-                self.log.debug(msg)
-                response = requests.request(
-                    self._verb,
-                    self._url,
-                    headers=self._get_headers(),
-                    verify=False,
-                    timeout=self._timeout,
-                )
+                response = self._send(self._verb, self._url, None, headers)
             else:
-                msg_payload = copy.deepcopy(self._payload)
-                if "userPasswd" in msg_payload:
-                    msg_payload["userPasswd"] = "********"
-                msg += ", payload: "
-                msg += f"{json.dumps(msg_payload, indent=4, sort_keys=True)}"
-                self.log.debug(msg)
-                response = requests.request(
-                    self.verb,
-                    self._url,
-                    headers=self._get_headers(),
-                    data=json.dumps(self.payload),
-                    verify=False,
-                    timeout=self._timeout,
+                response = self._send(
+                    self._verb, self._url, _json_dumps(self._payload), headers
                 )
-        except requests.exceptions.ConnectionError as error:
+        except _CONNECTION_ERRORS as error:
             msg = f"{self.class_name}.{method_name}: "
-            msg = "Error connecting to the controller. "
+            msg += "Error connecting to the controller. "
             msg += f"Error detail: {error}"
             raise ValueError(msg) from error
         self._payload = {}
-        self._gen_response(response)
+        self._gen_response(response, etag_url)
 
-    def _get_headers(self) -> dict[str, str]:
+    def commit_batch(
+        self,
+        batch: list[tuple[str, str, Union[dict[str, Any], None]]],
+        max_workers: int = 10,
+    ) -> list[dict[str, Any]]:
         """
         # Summary
 
-        Returns the headers to use for the REST request.
+        Send several REST requests to the controller concurrently and
+        return their response dicts in the same order as `batch`.
+
+        Each item in `batch` is a `(verb, path, payload)` tuple.  Use
+        `None` for `payload` to send no request body.  Requests share the
+        pooled connections of this instance, so `max_workers` should not
+        exceed the pool size (20).
+
+        After the call, `response` holds the response for the last item
+        in `batch`.  `path`, `verb` and `payload` are not modified.
 
         ## Raises
 
-        None
+        -   `ValueError` if:
+                -   `ip4` or `ip6` is not set.
+                -   any item in `batch` has an empty verb or path.
+                -   the controller cannot be reached.
+
+        ## Usage
+
+        ```python
+        responses = sender.commit_batch(
+            [
+                ("GET", ep_template_1.path, None),
+                ("GET", ep_template_2.path, None),
+            ]
+        )
+        ```
         """
-        headers: dict[str, str] = {}
-        headers["Cookie"] = f"AuthCookie={self._token}"
-        headers["AuthCookie"] = self._token
-        headers["Content-Type"] = "application/json"
-        headers["Authorization"] = self._token
-        return copy.copy(headers)
+        method_name: str = "commit_batch"
+        if not self._ip4 and not self._ip6:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += f"ip4 or ip6 must be set before calling {method_name}()."
+            raise ValueError(msg)
+        requests_to_send: list[tuple[str, str, Union[bytes, str, None]]] = []
+        for verb, path, payload in batch:
+            if not verb or not path:
+                msg = f"{self.class_name}.{method_name}: "
+                msg += "verb and path must be set for every batch item. "
+                msg += f"Got verb {verb}, path {path}."
+                raise ValueError(msg)
+            data = None if payload is None else _json_dumps(payload)
+            requests_to_send.append((verb, self._build_url(path), data))
 
-    def _get_host(self) -> str:
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(
+                    executor.map(lambda item: self._send(*item), requests_to_send)
+                )
+        except _CONNECTION_ERRORS as error:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "Error connecting to the controller. "
+            msg += f"Error detail: {error}"
+            raise ValueError(msg) from error
+
+        # Process responses on this thread, in submission order, so token
+        # updates from Set-Cookie are applied deterministically.
+        response_dicts: list[dict[str, Any]] = []
+        for response in responses:
+            self._gen_response(response)
+            response_dicts.append(self._response)
+        return response_dicts
+
+    def _send(
+        self,
+        verb: str,
+        url: str,
+        data: Union[bytes, str, None],
+        headers: Union[dict[str, str], None] = None,
+    ) -> Union[requests.Response, "httpx.Response"]:
         """
         # Summary
 
-        Returns the server IP address to use based on the values
-        of ip4 and ip6.
+        Send the request for `verb` to `url` using the configured
+        backend (`requests.Session`, or `httpx.Client` if ND_HTTP2=1).
+        `headers`, if given, are sent in addition to the session headers.
+
+        Does not modify instance state, so it is safe to call from
+        several threads at once.
 
         ## Raises
 
-        -   `ValueError` if neither `ip4` nor `ip6` is set.
+        -   Backend connection errors.  See `_CONNECTION_ERRORS`.
         """
-        method_name: str = inspect.stack()[0][3]
-        if self._ip4:
-            return self._ip4
-        if self._ip6:
-            return self._ip6
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "ip4 or ip6 must be set before calling "
-        msg += f"{self.class_name}.commit()"
-        self.log.debug(msg)
-        raise ValueError(msg)
+        if self._client is not None:
+            return self._client.request(
+                verb,
+                url,
+                content=data,
+                headers=headers,
+                timeout=self._timeout,
+            )
+        return self._session.request(
+            verb,
+            url,
+            data=data,
+            headers=headers,
+            verify=False,
+            timeout=self._timeout,
+        )
+
+    def _set_token(self, token: str) -> None:
+        """
+        # Summary
 
-    def _set_url(self) -> None:
+        Set the auth token and update the authentication headers sent
+        with every request by the session (and httpx client, if used).
+
+        ## Raises
+
+        None
+        """
+        self._token = token
+        auth_headers: dict[str, str] = {
+            "Cookie": f"AuthCookie={token}",
+            "AuthCookie": token,
+            "Authorization": token,
+        }
+        self._session.headers.update(auth_headers)
+        if self._client is not None:
+            self._client.headers.update(auth_headers)
+
+    def _update_base_url(self) -> None:
         """
         # Summary
 
-        Sets the full URL for the REST request based on the
-        `path` and `ip4`/`ip6` properties.
+        Cache the `https://<host>` prefix used by `_build_url()` based on
+        the values of ip4 and ip6.  If both are set, ip4 is used.
+
+        Called whenever ip4 or ip6 changes.
 
         ## Raises
 
-        -   `ValueError` if `path` is not set.
+        None
         """
-        method_name: str = inspect.stack()[0][3]
-        if self.path is None:
-            msg = f"{self.class_name}.{method_name}: "
-            msg += "call Sender.path before calling "
-            msg += f"{self.class_name}.commit()"
-            self.log.debug(msg)
-            raise ValueError(msg)
-        if self.path[0] == "/":
-            self._url = f"https://{self._get_host()}{self.path}"
-        else:
-            self._url = f"https://{self._get_host()}/{self.path}"
-        msg = f"{self.class_name}.{method_name}: "
-        msg += f"Set url to {self._url}"
-        self.log.debug(msg)
+        host = self._ip4 or self._ip6
+        self._base_url = f"https://{host}" if host else ""
 
-    def _add_history_rc(self, x):
+    def _build_url(self, path: str) -> str:
         """
         # Summary
 
-        Add a return code to the history deque.
+        Return the full URL for `path` based on the `ip4`/`ip6`
+        properties.
 
         ## Raises
 
-        None
+        -   `ValueError` if neither `ip4` nor `ip6` is set.
         """
-        self._history_rc.appendleft(x)
+        method_name: str = "_build_url"
+        if not self._base_url:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "ip4 or ip6 must be set before calling "
+            msg += f"{self.class_name}.commit()"
+            self.log.debug(msg)
+            raise ValueError(msg)
+        if path.startswith("/"):
+            return self._base_url + path
+        return f"{self._base_url}/{path}"
 
-    def _add_history_path(self, path: str):
+    def _set_url(self) -> None:
         """
         # Summary
 
-        Add a path to the history deque.
+        Sets the full URL for the REST request based on the
+        `path` and `ip4`/`ip6` properties.
 
         ## Raises
 
-        None
+        -   `ValueError` if `path` is not set.
         """
-        self._history_path.appendleft(path)
+        method_name: str = "_set_url"
+        if self._path is None:
+            msg = f"{self.class_name}.{method_name}: "
+            msg += "call Sender.path before calling "
+            msg += f"{self.class_name}.commit()"
+            self.log.debug(msg)
+            raise ValueError(msg)
+        self._url = self._build_url(self._path)
+        self.log.debug("%s.%s: Set url to %s", self.class_name, method_name, self._url)
 
     def _update_status(self):
         """
@@ -348,44 +661,104 @@ class Sender:
         """
         self._last_rc = self._return_code
         self._last_url = self._url
-        self._add_history_rc(self._return_code)
-        self._add_history_path(self._url)
+        self._history.appendleft((self._return_code, self._url))
 
-    def _gen_response(self, response: requests.Response) -> None:
+    def _gen_response(
+        self,
+        response: Union[requests.Response, "httpx.Response"],
+        etag_url: Union[str, None] = None,
+    ) -> None:
         """
         # Summary
 
         Generate a response dictionary from the requests response object.
 
+        If `etag_url` is set (see `commit()`):
+
+        -   A 200 response that carries an ETag has its DATA cached for
+            `etag_url`, evicting the least recently used entry beyond
+            `_ETAG_CACHE_SIZE`.
+        -   A 304 (Not Modified) response is replaced with the cached
+            DATA and reported as 200/OK, so callers see the same result
+            as a full GET.
+
         ## Raises
 
         None
         """
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "_gen_response"
         # set the token to the value of Set-Cookie in the
         # response headers (if present)
-        token = response.headers.get("Set-Cookie", None)
-        if token is not None:
-            token = token.split("=")[1]
-            token = token.split(";")[0]
-            self._token = token
-            msg = f"{self.class_name}.{method_name}: "
-            msg += f"Set new token to {self._token}"
-            self.log.debug(msg)
+        set_cookie = response.headers.get("Set-Cookie", None)
+        if set_cookie is not None:
+            # "AuthCookie=<token>; Path=/; ..." -> "<token>"
+            # partition() keeps any "=" inside the token value.
+            _, _, value = set_cookie.partition("=")
+            token, _, _ = value.partition(";")
+            self._set_token(token)
+            self.log.debug(
+                "%s.%s: Set new token to %s", self.class_name, method_name, token
+            )
+
+        method = response.request.method
+        cached = None
+        if etag_url is not None and response.status_code == 304:
+            cached = self._etag_cache.get(etag_url)
 
         response_dict: dict[str, Any] = {}
-        self._return_code = response.status_code
-        response_dict["RETURN_CODE"] = response.status_code
-        try:
-            response_dict["DATA"] = json.loads(response.text)
-        except json.JSONDecodeError:
-            data: dict[str, Any] = {}
-            data["INVALID_JSON"] = response.text
-            response_dict["DATA"] = data
-        response_dict["MESSAGE"] = response.reason
-        response_dict["METHOD"] = response.request.method
-        response_dict["REQUEST_PATH"] = response.url
-        self.response = copy.deepcopy(response_dict)
+        if etag_url is not None and cached is not None:
+            self.log.debug(
+                "%s.%s: Not modified. Using cached DATA for %s",
+                self.class_name,
+                method_name,
+                etag_url,
+            )
+            self._etag_cache.move_to_end(etag_url)
+            self._return_code = 200
+            response_dict["RETURN_CODE"] = 200
+            response_dict["DATA"] = cached[1]
+            response_dict["MESSAGE"] = "OK"
+        else:
+            self._return_code = response.status_code
+            response_dict["RETURN_CODE"] = response.status_code
+            try:
+                # Decode from the raw bytes rather than via response.text.
+                response_dict["DATA"] = _json_loads(response.content)
+            except ValueError:
+                data: dict[str, Any] = {}
+                data["INVALID_JSON"] = response.text
+                response_dict["DATA"] = data
+            if isinstance(response, requests.Response):
+                response_dict["MESSAGE"] = response.reason
+            else:
+                response_dict["MESSAGE"] = response.reason_phrase
+            etag = response.headers.get("ETag", None)
+            if etag_url is not None and response.status_code == 200 and etag:
+                self._etag_cache[etag_url] = (etag, response_dict["DATA"])
+                self._etag_cache.move_to_end(etag_url)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        response_dict["METHOD"] = method
+        response_dict["REQUEST_PATH"] = str(response.url)
+        self._response = response_dict
+
+    def enable_etag_cache(self, path: str) -> None:
+        """
+        # Summary
+
+        Send GET requests for `path` as conditional GETs.
+
+        The DATA of the last 200 response that carried an ETag is kept,
+        and the next GET for `path` is sent with If-None-Match.  If the
+        controller replies 304 (Not Modified), `response` contains the
+        kept DATA with RETURN_CODE 200 and MESSAGE "OK".  At most
+        `_ETAG_CACHE_SIZE` responses are kept per instance.
+
+        ## Raises
+
+        None
+        """
+        self._etag_paths.add(path)
 
     def login(self) -> None:
         """
@@ -404,30 +777,30 @@ class Sender:
             return
         _raise = False
         msg: str = ""
-        if not self.username:
+        if not self._username:
             msg = "call Sender.username before calling Sender.login()"
             _raise = True
-        if not self.password:
+        if not self._password:
             msg = "call Sender.password before calling Sender.login()"
             _raise = True
-        if not self.domain:
+        if not self._domain:
             msg = "call Sender.domain before calling Sender.login()"
             _raise = True
         if _raise is True:
             self.log.debug(msg)
             raise ValueError(msg)
         self._logged_in = False
-        self.path = "/login"
+        self._path = "/login"
         self._set_url()
         payload: dict[str, Any] = {}
-        payload["userName"] = self.username
-        payload["userPasswd"] = self.password
-        payload["domain"] = self.domain
-        self.payload = copy.copy(payload)
+        payload["userName"] = self._username
+        payload["userPasswd"] = self._password
+        payload["domain"] = self._domain
+        self._payload = payload
         headers = {}
         headers["Content-Type"] = "application/json"
-        self.headers = copy.copy(headers)
-        self.verb = "POST"
+        self.headers = headers
+        self._verb = "POST"
         self.commit()
         self._update_token()
         self._logged_in = True
@@ -443,12 +816,10 @@ class Sender:
         -   `ValueError` if:
                 -   unable to parse token from response.
         """
-        method_name: str = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "ENTERED"
-        self.log.debug(msg)
+        method_name: str = "_update_token"
+        self.log.debug("%s.%s: ENTERED", self.class_name, method_name)
         try:
-            self._token = self.response["DATA"]["jwttoken"]
+            self._set_token(self.response["DATA"]["jwttoken"])
             self._jwttoken = self.response["DATA"]["jwttoken"]
             self._rbac = self.response["DATA"]["rbac"]
         except KeyError as error:
@@ -471,37 +842,36 @@ class Sender:
                 -   `password` is not set.
                 -   `domain` is not set.
         """
-        method_name: str = inspect.stack()[0][3]
-        msg = f"{self.class_name}.{method_name}: "
-        msg += "ENTERED"
-        self.log.debug(msg)
+        method_name: str = "refresh_login"
+        self.log.debug("%s.%s: ENTERED", self.class_name, method_name)
 
-        if not self.username:
+        if not self._username:
             msg = f"{self.class_name}.{method_name}: "
             msg += "call Sender.username before calling "
             msg += "Sender.refresh_login()"
             self.log.debug(msg)
             raise ValueError(msg)
-        if not self.password:
+        if not self._password:
             msg = f"{self.class_name}.{method_name}: "
             msg += "call Sender.password before calling "
             msg += "Sender.refresh_login()"
             self.log.debug(msg)
             raise ValueError(msg)
-        if not self.domain:
+        if not self._domain:
             msg = f"{self.class_name}.{method_name}: "
             msg += "call Sender.domain before calling "
             msg += "Sender.refresh_login()"
             self.log.debug(msg)
             raise ValueError(msg)
 
-        self.path = "/refresh"
+        self._path = "/refresh"
+        self._verb = "POST"
         self._set_url()
         payload: dict[str, Any] = {}
-        payload["userName"] = self.username
-        payload["userPasswd"] = self.password
-        payload["domain"] = self.domain
-        self.payload = payload
+        payload["userName"] = self._username
+        payload["userPasswd"] = self._password
+        payload["domain"] = self._domain
+        self._payload = payload
         headers: dict[str, str] = {}
         headers["Content-Type"] = "application/json"
         headers["Cookie"] = f"AuthCookie={self._jwttoken}"
@@ -560,9 +930,8 @@ class Sender:
         msg += f"{'RESULT_CODE':<11} {'Path':<70}\n"
         msg += f"{'-' * 11:<11} {'-' * 70:<70}"
         self.log.debug(msg)
-        for rc, path in zip(self.history_rc, self.history_path):
-            msg = f"{rc:<11d} {path:<70}"
-            self.log.debug(msg)
+        for rc, path in self._history:
+            self.log.debug("%-11d %-70s", rc, path)
 
     @property
     def history_rc(self) -> list[int]:
@@ -575,7 +944,7 @@ class Sender:
 
         None
         """
-        return list(self._history_rc)
+        return [rc for rc, _ in self._history]
 
     @property
     def history_path(self) -> list[str]:
@@ -588,7 +957,7 @@ class Sender:
 
         None
         """
-        return list(self._history_path)
+        return [path for _, path in self._history]
 
     @property
     def implements(self) -> str:
@@ -619,6 +988,7 @@ class Sender:
     @ip4.setter
     def ip4(self, value: str) -> None:
         self._ip4 = value
+        self._update_base_url()
 
     @property
     def ip6(self) -> str:
@@ -636,6 +1006,7 @@ class Sender:
     @ip6.setter
     def ip6(self, value: str) -> None:
         self._ip6 = value
+        self._update_base_url()
 
     @property
     def last_rc(self) -> int:
@@ -699,7 +1070,7 @@ class Sender:
 
     @payload.setter
     def payload(self, value: dict[str, Any]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "payload"
         if not isinstance(value, dict):
             msg = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -732,16 +1103,23 @@ class Sender:
 
         The response from the controller.
 
+        The getter returns the stored dict itself rather than a copy.
+        Callers must not modify it.
+
+        For paths registered with `enable_etag_cache()`, a 304 (Not
+        Modified) response is reported as RETURN_CODE 200, MESSAGE "OK",
+        with the cached DATA.
+
         ## Raises
 
         -   `TypeError` if value is not a `dict`.
 
         """
-        return copy.deepcopy(self._response)
+        return self._response
 
     @response.setter
     def response(self, value: dict[str, Any]) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "response"
         if not isinstance(value, dict):
             msg: str = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be a dict. "
@@ -765,7 +1143,7 @@ class Sender:
 
     @timeout.setter
     def timeout(self, value: int) -> None:
-        method_name: str = inspect.stack()[0][3]
+        method_name: str = "timeout"
         if not isinstance(value, int):
             msg: str = f"{self.class_name}.{method_name}: "
             msg += f"{method_name} must be an int. "
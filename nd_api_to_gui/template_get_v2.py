@@ -20,7 +20,6 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type  # pylint: disable=invalid-name
 __author__ = "Allen Robel"
 
-import copy
 import inspect
 import logging
 from typing import Any
@@ -159,10 +158,11 @@ class TemplateGet:
         self.rest_send.timeout = 2
         self.rest_send.commit()
 
-        self.response_current = copy.deepcopy(self.rest_send.response_current)
-        self.response.append(copy.deepcopy(self.rest_send.response_current))
-        self.result_current = copy.deepcopy(self.rest_send.result_current)
-        self.result.append(copy.deepcopy(self.rest_send.result_current))
+        # RestSend.response_current and result_current already return copies.
+        self.response_current = self.rest_send.response_current
+        self.response.append(self.response_current)
+        self.result_current = self.rest_send.result_current
+        self.result.append(self.result_current)
 
         controller_return_code = self.response_current.get("RETURN_CODE", None)
         controller_message = self.response_current.get("MESSAGE", None)
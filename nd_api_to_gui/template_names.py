@@ -20,9 +20,9 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type  # pylint: disable=invalid-name
 __author__ = "Allen Robel"
 
-import copy
 import inspect
 import logging
+from operator import itemgetter
 from typing import Any
 
 from nd_api_to_gui.ep_templates import EpTemplates
@@ -111,12 +111,15 @@ class TemplateNames:
         self.rest_send.verb = self.ep_templates.verb
         self.rest_send.check_mode = False
         self.rest_send.timeout = 2
+        # The template list changes rarely.  Re-fetch it only if modified.
+        self.rest_send.sender.enable_etag_cache(self.ep_templates.path)
         self.rest_send.commit()
 
-        self.response_current = copy.deepcopy(self.rest_send.response_current)
-        self.result_current = copy.deepcopy(self.rest_send.result_current)
-        self._response.append(copy.deepcopy(self.rest_send.response_current))
-        self._result.append(copy.deepcopy(self.rest_send.result_current))
+        # RestSend.response_current and result_current already return copies.
+        self.response_current = self.rest_send.response_current
+        self.result_current = self.rest_send.result_current
+        self._response.append(self.response_current)
+        self._result.append(self.result_current)
 
         controller_return_code = self.response_current.get("RETURN_CODE", None)
         controller_message = self.response_current.get("MESSAGE", None)
@@ -128,9 +131,12 @@ class TemplateNames:
             self.log.error(msg)
             raise ControllerResponseError(msg)
 
-        self._template_names = [
-            item.get("name") for item in self.response_current.get("DATA", [])
-        ]
+        data = self.response_current.get("DATA") or []
+        try:
+            self._template_names = list(map(itemgetter("name"), data))
+        except KeyError:
+            # Fall back for entries without a name.
+            self._template_names = [item.get("name") for item in data]
 
     @property
     def rest_send(self) -> RestSend: